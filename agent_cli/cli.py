@@ -262,15 +262,17 @@ def handle_chat_response(
             except StopIteration:
                 first_token = None
 
-        # Start printing
-        if first_token:
-            ui_instance.print_stream_chunk(first_token)
-            response_parts.append(first_token)
-
-        for token in stream_gen:
-            ui_instance.print_stream_chunk(token)
-            response_parts.append(token)
-
+        # Start printing; buffered text is written out even if the stream fails
+        try:
+            if first_token:
+                ui_instance.print_stream_chunk(first_token)
+                response_parts.append(first_token)
+
+            for token in stream_gen:
+                ui_instance.print_stream_chunk(token)
+                response_parts.append(token)
+        finally:
+            ui_instance.finalize_stream()
         ui_instance.console.print("\n")
         return "".join(response_parts)
     else:
@@ -1,16 +1,34 @@
 """Token counting utilities for context management."""
 
+from collections.abc import Sequence
+from functools import lru_cache
+
+# (threshold, divisor, suffix) used by format_token_count, largest first
+_FMT_THRESHOLDS = ((1_000_000, 1_000_000, "M"), (1_000, 1_000, "K"))
+
+# Context usage status, indexed by how many thresholds (75%, 90%) are crossed
+_STATUS = ("ok", "warning", "critical")
+
 
 class TokenCounter:
     """Estimate token counts for different providers."""
 
     # Rough estimation: ~4 characters per token for English text
     CHARS_PER_TOKEN = 4
+    # Non-ASCII scripts (CJK, emoji) tokenize more densely: ~3 UTF-8 bytes per token
+    UTF8_BYTES_PER_TOKEN = 3
+    # Overhead for role and structure (~4 tokens per message)
+    MESSAGE_OVERHEAD_TOKENS = 4
 
     @staticmethod
     def estimate_tokens(text: str) -> int:
         """Estimate token count from text.
 
+        ASCII characters are estimated from their count. Non-ASCII characters
+        are estimated from their UTF-8 byte length, since multi-byte scripts
+        cost far more tokens per character than English; the two parts are
+        estimated separately so a stray em dash doesn't reprice the whole text.
+
         This is a rough approximation. For accurate counts:
         - OpenAI/Anthropic: Use tiktoken library
         - Google: Use their tokenizer
@@ -24,7 +42,29 @@ class TokenCounter:
         """
         if not text:
             return 0
-        return max(1, len(text) // TokenCounter.CHARS_PER_TOKEN)
+        if text.isascii():
+            return max(1, len(text) // TokenCounter.CHARS_PER_TOKEN)
+        ascii_chars = len(text.encode("ascii", errors="ignore"))
+        non_ascii_bytes = len(text.encode("utf-8", errors="replace")) - ascii_chars
+        return max(
+            1,
+            ascii_chars // TokenCounter.CHARS_PER_TOKEN
+            + non_ascii_bytes // TokenCounter.UTF8_BYTES_PER_TOKEN,
+        )
+
+    @staticmethod
+    def estimate_texts_batch(texts: Sequence[str]) -> int:
+        """Estimate total token count for a batch of texts.
+
+        Equivalent to summing estimate_tokens() over texts.
+
+        Args:
+            texts: Texts to count tokens for
+
+        Returns:
+            Estimated total tokens
+        """
+        return sum(map(TokenCounter.estimate_tokens, texts))
 
     @staticmethod
     def estimate_messages_tokens(messages: list[dict[str, str]]) -> int:
@@ -36,14 +76,9 @@ class TokenCounter:
         Returns:
             Estimated total tokens
         """
-        total = 0
-        for msg in messages:
-            # Count content tokens
-            content = msg.get("content", "")
-            total += TokenCounter.estimate_tokens(content)
-            # Add overhead for role and structure (~4 tokens per message)
-            total += 4
-        return total
+        contents = [msg.get("content", "") for msg in messages]
+        overhead = TokenCounter.MESSAGE_OVERHEAD_TOKENS * len(contents)
+        return TokenCounter.estimate_texts_batch(contents) + overhead
 
     @staticmethod
     def get_context_percentage(current_tokens: int, max_tokens: int) -> tuple[float, str]:
@@ -59,18 +94,11 @@ class TokenCounter:
         if max_tokens <= 0:
             return 0.0, "ok"
 
-        percentage = (current_tokens / max_tokens) * 100
-
-        if percentage >= 90:
-            status = "critical"
-        elif percentage >= 75:
-            status = "warning"
-        else:
-            status = "ok"
-
-        return percentage, status
+        percentage = (current_tokens / max_tokens) * 100.0
+        return percentage, _STATUS[(percentage >= 75.0) + (percentage >= 90.0)]
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def format_token_count(count: int) -> str:
         """Format token count for display.
 
@@ -80,9 +108,7 @@ class TokenCounter:
         Returns:
             Formatted string (e.g., "1.2K", "500")
         """
-        if count >= 1_000_000:
-            return f"{count / 1_000_000:.1f}M"
-        elif count >= 1_000:
-            return f"{count / 1_000:.1f}K"
-        else:
-            return str(count)
+        for threshold, divisor, suffix in _FMT_THRESHOLDS:
+            if count >= threshold:
+                return f"{count / divisor:.1f}{suffix}"
+        return str(count)
@@ -3,22 +3,45 @@ Centralized UI module for Agent CLI using Rich and Prompt Toolkit.
 Provides styled output, spinners, themes, and interactive session management.
 """
 
+import os
 import sys
-from typing import Any
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import cache, cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Optional
 
 # Prompt Toolkit imports
-from prompt_toolkit import PromptSession
+from prompt_toolkit import Application, PromptSession
+from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.completion import Completer, Completion
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout import Layout
+from prompt_toolkit.layout.containers import Float, FloatContainer, HSplit, VSplit, Window
+from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
+from prompt_toolkit.layout.menus import CompletionsMenu
 from prompt_toolkit.shortcuts import CompleteStyle
+from prompt_toolkit.styles import BaseStyle, merge_styles
 from prompt_toolkit.styles import Style as PromptStyle
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.prompt import Prompt
 from rich.status import Status
-from rich.table import Table
 from rich.theme import Theme
 
+# The command registry is optional; without it the completer uses a static list
+try:
+    from agent_cli.command_registry import get_all_commands
+except ImportError:
+    get_all_commands = None
+
+# Likewise the Ollama manager; without it the keep-alive timer isn't shown
+try:
+    from agent_cli.ollama_manager import get_ollama_manager
+except ImportError:
+    get_ollama_manager = None
+
 # Define preset themes
 PRESET_THEMES = {
     "default": {
@@ -288,37 +311,263 @@ PRESET_THEMES = {
 }
 
 
+# Theme keys that are prompt_toolkit-only (completion menu, scrollbar) or our own
+# settings (border pattern); these are not valid Rich theme styles
+_EXCLUDED_RICH_KEYS = frozenset(
+    {
+        "border.pattern",
+        "completion-menu",
+        "completion-menu.completion",
+        "completion-menu.completion.current",
+        "completion-menu.meta",
+        "completion-menu.meta.completion",
+        "completion-menu.meta.completion.current",
+        "scrollbar.background",
+        "scrollbar.button",
+    }
+)
+
+
+@lru_cache(maxsize=512)
+def _convert_style(rich_style: str) -> str:
+    """Convert a Rich 'fg on bg' style to prompt_toolkit's 'fg bg:bg'."""
+    if " on " in rich_style:
+        fg, bg = rich_style.split(" on ", 1)
+        return f"{fg} bg:{bg}"
+    return rich_style
+
+
+# prompt_toolkit class -> (Rich theme key, fallback style), in rule order. A
+# fallback of None means "same as the prompt style"; a Rich key of None means
+# the fallback is used as-is
+_PT_STYLE_MAP: tuple[tuple[str, Optional[str], Optional[str]], ...] = (
+    ("prompt", "prompt", None),
+    ("bottom-toolbar", "status.bar", "reverse"),
+    ("bottom-toolbar.text", None, "#ffffff"),
+    ("prompt.border", "prompt.border", None),
+    ("prompt.text", "prompt.text", "#ffffff"),
+)
+
+# Completion menu classes map 1:1 onto theme keys of the same name
+_PT_COMPLETION_KEYS = (
+    "completion-menu.completion",
+    "completion-menu.completion.current",
+    "completion-menu.meta.completion",
+    "completion-menu.meta.completion.current",
+)
+
+
+def _build_prompt_style_dict(rich_styles: Mapping[str, str]) -> dict[str, str]:
+    """Map a theme's Rich styles to prompt_toolkit style rules."""
+    prompt_style = rich_styles["prompt"]
+    base_style: dict[str, str] = {}
+    for pt_key, rich_key, default in _PT_STYLE_MAP:
+        fallback = default or prompt_style
+        if rich_key is None:
+            base_style[pt_key] = fallback
+        else:
+            base_style[pt_key] = _convert_style(rich_styles.get(rich_key, fallback))
+
+    # Add completion menu styles if defined (prompt_toolkit expects exact class names)
+    if _PT_COMPLETION_KEYS[0] in rich_styles:
+        for key in _PT_COMPLETION_KEYS:
+            base_style[key] = _convert_style(rich_styles[key])
+
+    return base_style
+
+
+# Themes are static, so each preset's Rich Theme and prompt_toolkit Style is
+# built once on first use; switching themes and building prompts are then lookups
+@cache
+def _rich_theme(theme_name: str) -> Theme:
+    """Get the (cached) Rich theme for a preset."""
+    return Theme(_RICH_STYLES_BY_THEME[theme_name], inherit=False)
+
+
+@cache
+def _prompt_style(theme_name: str) -> PromptStyle:
+    """Get the (cached) prompt_toolkit style for a preset."""
+    return PromptStyle.from_dict(_build_prompt_style_dict(PRESET_THEMES[theme_name]))
+
+
+# Toolbar classes layered over the theme by the simple (unboxed) prompt
+_SIMPLE_TOOLBAR_STYLES = {
+    "bottom-toolbar": "noreverse",
+    "toolbar.model": "bold",
+    "toolbar.stats": "#888888",
+    "toolbar.timer": "ansiyellow",
+    "toolbar.meta": "italic #888888",
+}
+
+
+@cache
+def _session_prompt_style(theme_name: str) -> BaseStyle:
+    """Get the (cached) style the interactive prompt runs with for a preset."""
+    if theme_name == "simple":
+        overlay = _SIMPLE_TOOLBAR_STYLES
+    else:
+        border_color = PRESET_THEMES[theme_name].get("prompt.border", "#888888")
+        overlay = {"border": border_color, "prompt": "bold"}
+    return merge_styles([_prompt_style(theme_name), PromptStyle.from_dict(overlay)])
+
+
+# Many themes repeat the same color strings; intern them so equal values share
+# one object (and compare by identity) in Rich/prompt_toolkit style lookups
+for _theme_data in PRESET_THEMES.values():
+    for _key, _value in _theme_data.items():
+        _theme_data[_key] = sys.intern(_value)
+del _theme_data, _key, _value
+
+# Read-only views, inner theme dicts included: the caches above must stay in
+# sync with the theme data
+PRESET_THEMES = MappingProxyType(
+    {name: MappingProxyType(data) for name, data in PRESET_THEMES.items()}
+)
+
+# Each preset's styles minus the prompt_toolkit-only keys Rich can't use; the
+# Theme objects themselves stay lazy since not every preset parses in Rich
+_RICH_STYLES_BY_THEME: dict[str, dict[str, str]] = {
+    name: {k: v for k, v in data.items() if k not in _EXCLUDED_RICH_KEYS}
+    for name, data in PRESET_THEMES.items()
+}
+
+
+@lru_cache(maxsize=64)
+def _shorten_model_name(model: str) -> str:
+    """Shorten long model names for display (memoized; model names repeat)."""
+    if not model or model == "Unknown":
+        return model
+
+    # Remove version tags and suffixes after : or @ symbols
+    # e.g., "devstral-small-2:24b" -> "devstral-small"
+    base_name = model.split(":")[0].split("@")[0]
+
+    # If still too long (>20 chars), truncate with ellipsis
+    if len(base_name) > 20:
+        return base_name[:17] + "..."
+
+    return base_name
+
+
+# Nerd Font icons (requires Nerd Font installed)
+_NERD_ICONS = {
+    "openai": "",  # nf-md-robot icon
+    "anthropic": "",  # nf-md-brain icon
+    "google": "",  # nf-md-google icon
+    "ollama": "󰝰",  # nf-md-llama icon (or  for meta)
+}
+
+# Emoji provider icons (work everywhere)
+_EMOJI_ICONS = {
+    "openai": "🤖",  # Robot for ChatGPT/OpenAI
+    "anthropic": "🧠",  # Brain for Claude
+    "google": "✨",  # Sparkle for Gemini
+    "ollama": "🦙",  # Llama for Ollama
+}
+
+# Toolbar connection status indicators
+_TOK_CONN_UP = ("fg:ansigreen", " * ")
+_TOK_CONN_DOWN = ("fg:ansired", " x ")
+
+
+def _keepalive_tenths(remaining_seconds: int) -> int:
+    """Round keep-alive seconds to the tenths of a minute (6s steps) displayed."""
+    return (remaining_seconds + 3) // 6
+
+
+# Streamed response text is written out once this many characters are pending
+_STREAM_FLUSH_CHARS = 128
+# ...or once this many seconds have passed since the last write, so slow
+# streams still show every chunk as it arrives
+_STREAM_FLUSH_INTERVAL = 0.05
+
+# Formatted text as passed to FormattedTextControl
+_Tokens = list[tuple[str, str]]
+
+# Side borders of the boxed prompt; shared, never mutated
+_LEFT_BORDER_TOKENS: _Tokens = [("class:border", "│ ")]
+_RIGHT_BORDER_TOKENS: _Tokens = [("class:border", "│")]
+
+# Prompt border lines kept per InteractiveSession (theme/width combinations)
+_BORDER_CACHE_SIZE = 8
+
+# Border char -> that char repeated past any realistic terminal width
+_BORDER_STRIPES: dict[str, str] = {}
+
+# Slash commands offered for completion when the command registry is unavailable
+_FALLBACK_COMMANDS = (
+    "/help",
+    "/model",
+    "/provider",
+    "/stream",
+    "/clear",
+    "/history",
+    "/session",
+    "/config",
+    "/mcp",
+    "/set",
+    "/theme",
+    "/agent",
+    "/keepalive",
+    "/reasoning",
+    "/compress",
+    "/beads",
+    "/init",
+    "/context",
+    "/hooks",
+)
+
+# Static argument completions for commands that take a fixed set of options
+_SUBCOMMAND_OPTIONS: dict[str, dict[str, None]] = {
+    "/provider": dict.fromkeys(("ollama", "openai", "anthropic", "google")),
+    "/stream": dict.fromkeys(("true", "false")),
+    "/set": dict.fromkeys(
+        (
+            "ollama_base_url",
+            "openai_api_key",
+            "anthropic_api_key",
+            "google_api_key",
+            "default_ollama_model",
+            "default_openai_model",
+            "default_anthropic_model",
+            "default_google_model",
+            "THEME",
+        )
+    ),
+    "/theme": dict.fromkeys(PRESET_THEMES),
+    "/agent": dict.fromkeys(("create", "list", "use", "delete", "show")),
+    "/beads": dict.fromkeys(("status", "context")),
+    "/context": dict.fromkeys(("status", "update", "view", "add")),
+    "/hooks": dict.fromkeys(("install", "uninstall", "list")),
+}
+
+
 class ThemeManager:
     """Manages UI themes."""
 
     def __init__(self, console: Console):
         self.console = console
         self.current_theme_name = "default"
-        self.current_theme_data = PRESET_THEMES["default"]  # Store full data
+        self.current_theme_data: Mapping[str, str] = PRESET_THEMES["default"]  # Store full data
+        # Whether set_theme has pushed a theme onto the console's theme stack
+        self._pushed = False
 
     def set_theme(self, theme_name: str):
         """Set the current theme."""
         if theme_name not in PRESET_THEMES:
             raise ValueError(f"Theme '{theme_name}' not found.")
 
+        # Build the Rich theme first: if it fails to parse, the previously
+        # set theme stays active and on the stack
+        theme = _rich_theme(theme_name)
+
         self.current_theme_name = theme_name
         self.current_theme_data = PRESET_THEMES[theme_name]
-
-        # Filter out non-Rich style keys before creating Rich Theme
-        # (completion-menu and scrollbar are prompt_toolkit-only styles)
-        excluded_keys = {
-            "border.pattern",
-            "completion-menu",
-            "completion-menu.completion",
-            "completion-menu.completion.current",
-            "completion-menu.meta",
-            "completion-menu.meta.completion",
-            "completion-menu.meta.completion.current",
-            "scrollbar.background",
-            "scrollbar.button",
-        }
-        styles = {k: v for k, v in self.current_theme_data.items() if k not in excluded_keys}
-        self.console.push_theme(Theme(styles, inherit=False))
+        # Replace the previously set theme instead of stacking another on top
+        if self._pushed:
+            self.console.pop_theme()
+        self.console.push_theme(theme)
+        self._pushed = True
 
     def get_available_themes(self) -> list[str]:
         """Get list of available themes."""
@@ -326,43 +575,7 @@ class ThemeManager:
 
     def get_current_style_for_prompt(self) -> PromptStyle:
         """Get a prompt_toolkit style object matching the current theme."""
-        # Map Rich styles to prompt_toolkit styles
-        rich_styles = self.current_theme_data
-
-        def convert_style(rich_style: str) -> str:
-            """Convert 'fg on bg' to 'fg bg:bg'."""
-            if " on " in rich_style:
-                fg, bg = rich_style.split(" on ")
-                return f"{fg} bg:{bg}"
-            return rich_style
-
-        # Basic style from prompt/toolbar colors
-        base_style = {
-            "prompt": convert_style(rich_styles["prompt"]),
-            "bottom-toolbar": convert_style(rich_styles.get("status.bar", "reverse")),
-            "bottom-toolbar.text": "#ffffff",
-            # Add borders
-            "prompt.border": convert_style(rich_styles.get("prompt.border", rich_styles["prompt"])),
-            "prompt.text": convert_style(rich_styles.get("prompt.text", "#ffffff")),
-        }
-
-        # Add completion menu styles if defined (using direct mapping)
-        # prompt_toolkit expects exact class names
-        if "completion-menu.completion" in rich_styles:
-            base_style["completion-menu.completion"] = convert_style(
-                rich_styles["completion-menu.completion"]
-            )
-            base_style["completion-menu.completion.current"] = convert_style(
-                rich_styles["completion-menu.completion.current"]
-            )
-            base_style["completion-menu.meta.completion"] = convert_style(
-                rich_styles["completion-menu.meta.completion"]
-            )
-            base_style["completion-menu.meta.completion.current"] = convert_style(
-                rich_styles["completion-menu.meta.completion.current"]
-            )
-
-        return PromptStyle.from_dict(base_style)
+        return _prompt_style(self.current_theme_name)
 
 
 class InteractiveSession:
@@ -396,143 +609,180 @@ class InteractiveSession:
                 "/system": "Set system prompt",
                 "/project": "Project configuration",
             }
+            # Sorted command/subcommand keys, built lazily (see invalidate())
+            self._sorted_cmds: Optional[tuple[str, ...]] = None
+            self._sorted_subs: dict[str, tuple[str, ...]] = {}
+            # Completions for a bare "/", the most common trigger
+            self._all_slash_completions: tuple[Completion, ...] = ()
+
+        def invalidate(self):
+            """Drop sorted key caches; call after mutating or replacing self.commands."""
+            self._sorted_cmds = None
+            self._sorted_subs = {}
+            self._all_slash_completions = ()
+
+        def _ensure_index(self) -> tuple[str, ...]:
+            """Sort command and subcommand keys once instead of on every keystroke.
+
+            Returns the sorted command keys.
+            """
+            if self._sorted_cmds is None:
+                self._sorted_cmds = sorted_cmds = tuple(sorted(self.commands))
+                self._sorted_subs = {
+                    cmd: tuple(sorted(sub))
+                    for cmd, sub in self.commands.items()
+                    if isinstance(sub, dict)
+                }
+                self._all_slash_completions = tuple(
+                    Completion(
+                        cmd,
+                        start_position=-1,
+                        display=cmd,
+                        display_meta=self.descriptions.get(cmd, ""),
+                    )
+                    for cmd in self._iter_prefix(sorted_cmds, "/")
+                )
+                return sorted_cmds
+            return self._sorted_cmds
+
+        def refresh_options(self, cmd: str):
+            """Re-sort one existing command's options after they changed.
+
+            Cheaper than invalidate() when the set of commands is unchanged.
+            """
+            if self._sorted_cmds is not None:
+                self._sorted_subs[cmd] = tuple(sorted(self.commands[cmd]))
+
+        def has_options(self, cmd: str) -> bool:
+            """Whether cmd takes a completable argument (e.g. "/model", "/provider")."""
+            self._ensure_index()
+            return cmd in self._sorted_subs
+
+        @staticmethod
+        def _iter_prefix(sorted_keys: tuple[str, ...], prefix: str):
+            """Yield keys starting with prefix; matches are contiguous in a sorted list."""
+            # Index from the bisect point (islice would step through every earlier key)
+            for i in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+                key = sorted_keys[i]
+                if not key.startswith(prefix):
+                    break
+                yield key
 
         def get_completions(self, document, complete_event):
             text = document.text_before_cursor
 
-            # If line works with slash
-            if text.startswith("/"):
-                parts = text.split()
-
-                # Case 1: Typing the command itself (e.g. "/mod")
-                if len(parts) <= 1 and (not text.endswith(" ")):
-                    current = parts[0] if parts else "/"
-                    for cmd in sorted(self.commands.keys()):
-                        if cmd.startswith(current):
-                            description = self.descriptions.get(cmd, "")
-                            # Yield completion with description
-                            yield Completion(
-                                cmd,
-                                start_position=-len(current),
-                                display=cmd,
-                                display_meta=description,
-                            )
-
-                # Case 2: Typing arguments (e.g. "/model gpt")
-                elif len(parts) >= 1:
-                    cmd = parts[0]
-                    if cmd in self.commands:
-                        sub = self.commands[cmd]
-                        # If sub is a dict (like model list or provider list)
-                        if isinstance(sub, dict):
-                            # Get the current arg text
-                            current_arg = "" if text.endswith(" ") else parts[-1]
-
-                            for sub_cmd in sorted(sub.keys()):
-                                if sub_cmd.startswith(current_arg):
-                                    yield Completion(
-                                        sub_cmd,
-                                        start_position=-len(current_arg),
-                                        display=sub_cmd,
-                                    )
+            # Fast path: a bare "/" lists every command
+            if text == "/":
+                self._ensure_index()
+                yield from self._all_slash_completions
+                return
+
+            if not text.startswith("/"):
+                return
+
+            sorted_cmds = self._ensure_index()
+            head, sep, current_arg = text.rpartition(" ")
+
+            # Case 1: Typing the command itself (e.g. "/mod")
+            if not sep:
+                for cmd in self._iter_prefix(sorted_cmds, text):
+                    description = self.descriptions.get(cmd, "")
+                    # Yield completion with description
+                    yield Completion(
+                        cmd,
+                        start_position=-len(text),
+                        display=cmd,
+                        display_meta=description,
+                    )
+                return
+
+            # Case 2: Typing arguments (e.g. "/model gpt")
+            # Only commands with a dict of options (like model or provider lists)
+            sub_keys = self._sorted_subs.get(head.split(" ", 1)[0])
+            if sub_keys is not None:
+                for sub_cmd in self._iter_prefix(sub_keys, current_arg):
+                    yield Completion(
+                        sub_cmd,
+                        start_position=-len(current_arg),
+                        display=sub_cmd,
+                    )
 
     def __init__(self, ui_manager):
         self.ui = ui_manager
-        # Initial completer dictionary
-        # Helper for set options
-        config_keys = {
-            "ollama_base_url": None,
-            "openai_api_key": None,
-            "anthropic_api_key": None,
-            "google_api_key": None,
-            "default_ollama_model": None,
-            "default_openai_model": None,
-            "default_anthropic_model": None,
-            "default_google_model": None,
-            "THEME": None,
-        }
-
+        self.provider = "Unknown"
+        self.model = "Unknown"
+        self.is_connected = False
+        # Prompt tokens and the (style, provider, prompt name) they were built for
+        self._prompt_tokens_key: Optional[tuple[str, str, str]] = None
+        self._prompt_tokens_cache: list[tuple[str, str]] = []
+        # Font support and provider icons can't change mid-session; resolve once
+        self._nerd_fonts = self._detect_nerd_fonts()
+        self._provider_icons: dict[str, str] = {}
+        # Agent whose token usage the toolbar shows, and its usage getter
+        self._agent = None
+        self._get_usage = None
+        # Last toolbar tokens and the (connected, provider, usage, timer) they show
+        self._toolbar_key: Optional[tuple] = None
+        self._toolbar_tokens: list[tuple[str, str]] = []
+        # (theme, width) -> (top, bottom) prompt border tokens, LRU-bounded
+        self._border_cache: OrderedDict[tuple[str, int], tuple[_Tokens, _Tokens]] = OrderedDict()
+
+    @cached_property
+    def completer_dict(self) -> dict[str, Any]:
+        """Slash-command completion tree, built on first use.
+
+        Deferred until a prompt needs it so that commands registered after the
+        UI is constructed (interactive_commands imports this module) are included.
+        """
         # Build completer dict from registered commands
-        # Try to load from command registry, but fall back to basic list if not available
-        try:
-            from agent_cli.command_registry import get_all_commands
-
-            registered_commands = get_all_commands()
-            self.completer_dict = {}
+        # Fall back to basic list if the command registry is not available
+        if get_all_commands is None:
+            completer_dict = dict.fromkeys(_FALLBACK_COMMANDS)
+        else:
+            completer_dict = {}
 
             # Add all registered commands
-            for cmd_name, cmd_info in registered_commands.items():
+            for cmd_name, cmd_info in get_all_commands().items():
                 # Only add primary command names (not aliases)
                 if cmd_name == cmd_info.name:
-                    self.completer_dict[f"/{cmd_name}"] = None
-
-        except (ImportError, Exception):
-            # Fallback to basic command list if registry not available
-            self.completer_dict = {
-                "/help": None,
-                "/model": None,
-                "/provider": None,
-                "/stream": None,
-                "/clear": None,
-                "/history": None,
-                "/session": None,
-                "/config": None,
-                "/mcp": None,
-                "/set": None,
-                "/theme": None,
-                "/agent": None,
-                "/keepalive": None,
-                "/reasoning": None,
-                "/compress": None,
-                "/beads": None,
-                "/init": None,
-                "/context": None,
-                "/hooks": None,
-            }
+                    completer_dict[f"/{cmd_name}"] = None
 
         # Add special completions for specific commands
-        if "/provider" in self.completer_dict:
-            self.completer_dict["/provider"] = {"ollama": None, "openai": None, "anthropic": None, "google": None}
-
-        if "/stream" in self.completer_dict:
-            self.completer_dict["/stream"] = {"true": None, "false": None}
-
-        if "/set" in self.completer_dict:
-            self.completer_dict["/set"] = config_keys
-
-        if "/theme" in self.completer_dict:
-            self.completer_dict["/theme"] = {t: None for t in ui_manager.theme_manager.get_available_themes()}
-
-        if "/agent" in self.completer_dict:
-            self.completer_dict["/agent"] = {"create": None, "list": None, "use": None, "delete": None, "show": None}
-
-        if "/beads" in self.completer_dict:
-            self.completer_dict["/beads"] = {"status": None, "context": None}
-
-        # Add subcommands for new commands
-        if "/context" in self.completer_dict:
-            self.completer_dict["/context"] = {"status": None, "update": None, "view": None, "add": None}
-
-        if "/hooks" in self.completer_dict:
-            self.completer_dict["/hooks"] = {"install": None, "uninstall": None, "list": None}
+        for cmd, options in _SUBCOMMAND_OPTIONS.items():
+            if cmd in completer_dict:
+                completer_dict[cmd] = options
 
         # Add common exit commands
-        self.completer_dict["exit"] = None
-        self.completer_dict["quit"] = None
+        completer_dict["exit"] = None
+        completer_dict["quit"] = None
 
-        self.slash_completer = InteractiveSession.SlashCommandCompleter(
-            self.completer_dict, self.ui
-        )
+        return completer_dict
+
+    @cached_property
+    def slash_completer(self) -> "InteractiveSession.SlashCommandCompleter":
+        """Completer for slash commands, built on first use."""
+        return InteractiveSession.SlashCommandCompleter(self.completer_dict, self.ui)
 
-        self.session = PromptSession(
+    @cached_property
+    def session(self) -> PromptSession:
+        """Underlying prompt_toolkit session, built on first use."""
+        return PromptSession(
             completer=self.slash_completer,
             style=self.ui.theme_manager.get_current_style_for_prompt(),
             complete_while_typing=True,
             complete_style=CompleteStyle.MULTI_COLUMN,
         )
-        self.provider = "Unknown"
-        self.model = "Unknown"
-        self.is_connected = False
+
+    @property
+    def agent(self):
+        """Agent whose token usage is shown in the toolbar (None if unset)."""
+        return self._agent
+
+    @agent.setter
+    def agent(self, agent):
+        self._agent = agent
+        # Resolve the usage getter once instead of probing on every toolbar render
+        self._get_usage = getattr(agent, "get_last_usage", None)
 
     def update_status(self, provider: str, model: str, connected: bool = True):
         """Update status bar info."""
@@ -542,111 +792,203 @@ class InteractiveSession:
 
     def update_completion_models(self, models: list[str]):
         """Update the list of models for autocomplete."""
-        # Update the dict directly
-        self.completer_dict["/model"] = {m: None for m in models}
-        # Re-initialize completer with updated dict
-        self.slash_completer.commands = self.completer_dict
+        new_options = dict.fromkeys(models)
+        options = self.completer_dict.get("/model")
+        if isinstance(options, dict) and options.keys() == new_options.keys():
+            return
+        new_command = "/model" not in self.completer_dict
+
+        # Swap in a new dict rather than mutating the one the completer may be
+        # reading, so readers always see a complete snapshot
+        commands = {**self.completer_dict, "/model": new_options}
+        self.completer_dict = commands
+        self.slash_completer.commands = commands
+
+        if new_command:
+            self.slash_completer.invalidate()
+        else:
+            self.slash_completer.refresh_options("/model")
 
     def _shorten_model_name(self, model: str) -> str:
         """Shorten long model names for display."""
-        if not model or model == "Unknown":
-            return model
-
-        # Remove version tags and suffixes after : or @ symbols
-        # e.g., "devstral-small-2:24b" -> "devstral-small"
-        base_name = model.split(":")[0].split("@")[0]
-
-        # If still too long (>20 chars), truncate with ellipsis
-        if len(base_name) > 20:
-            return base_name[:17] + "..."
-
-        return base_name
+        return _shorten_model_name(model)
 
-    def _has_nerd_fonts(self) -> bool:
-        """Check if Nerd Fonts are available."""
+    @staticmethod
+    def _detect_nerd_fonts() -> bool:
+        """Check the environment for Nerd Font support."""
         # Check if NERD_FONT env var is set
-        import os
         if os.getenv("NERD_FONT") == "1":
             return True
 
-        # Try to detect by checking common Nerd Font names in terminal
-        term_program = os.getenv("TERM_PROGRAM", "")
-        font_name = os.getenv("FONT_NAME", "")
-
-        # Common indicators
-        if "nerd" in font_name.lower() or "nf" in font_name.lower():
-            return True
-
+        # Try to detect by checking common Nerd Font names in terminal.
         # Default to False (use emojis) - user can set NERD_FONT=1 to enable
-        return False
+        font_name = os.getenv("FONT_NAME", "").lower()
+        return "nerd" in font_name or "nf" in font_name
+
+    def _has_nerd_fonts(self) -> bool:
+        """Check if Nerd Fonts are available."""
+        return self._nerd_fonts
 
     def _get_provider_icon(self, provider: str) -> str:
         """Get emoji/icon for provider with Nerd Font support."""
-
+        icon = self._provider_icons.get(provider)
+        if icon is None:
+            icon = self._provider_icons[provider] = self._lookup_provider_icon(provider)
+        return icon
+
+    def _lookup_provider_icon(self, provider: str) -> str:
+        """Resolve the icon for a provider (uncached)."""
+        provider = provider.lower()
         if self._has_nerd_fonts():
-            # Nerd Font icons (requires Nerd Font installed)
-            nerd_icons = {
-                "openai": "",  # nf-md-robot icon
-                "anthropic": "",  # nf-md-brain icon
-                "google": "",  # nf-md-google icon
-                "ollama": "󰝰",  # nf-md-llama icon (or  for meta)
-            }
-            icon = nerd_icons.get(provider.lower(), "")
+            icon = _NERD_ICONS.get(provider, "")
             if icon:
                 return icon
 
         # Fallback to emojis (works everywhere)
-        emoji_icons = {
-            "openai": "🤖",  # Robot for ChatGPT/OpenAI
-            "anthropic": "🧠",  # Brain for Claude
-            "google": "✨",  # Sparkle for Gemini
-            "ollama": "🦙",  # Llama for Ollama
-        }
-        return emoji_icons.get(provider.lower(), "💬")  # Default chat bubble
+        return _EMOJI_ICONS.get(provider, "💬")  # Default chat bubble
+
+    def _ollama_mgr(self):
+        """Get the Ollama manager, or None if ollama_manager isn't available."""
+        return get_ollama_manager() if get_ollama_manager is not None else None
+
+    def _ollama_remaining(self) -> Optional[int]:
+        """Get the Ollama keep-alive seconds remaining (None if unavailable)."""
+        ollama_mgr = self._ollama_mgr()
+        return ollama_mgr.get_time_remaining() if ollama_mgr is not None else None
 
     def _get_toolbar_tokens(self):
-        """Generate tokens for the bottom status toolbar."""
+        """Generate tokens for the bottom status toolbar.
+
+        Rebuilt only when something shown changes; idle redraws reuse the last list.
+        """
+        # Usage Stats
+        usage = None
+        if self._get_usage is not None:
+            last_usage = self._get_usage()
+            if last_usage["total_tokens"] > 0:
+                usage = (
+                    last_usage["prompt_tokens"],
+                    last_usage["completion_tokens"],
+                    last_usage["total_tokens"],
+                )
+
+        # Ollama keep-alive timer (only for ollama provider), in the 6s steps shown
+        timer_tenths = None
+        if self.provider == "ollama":
+            remaining_seconds = self._ollama_remaining()
+            if remaining_seconds is not None and remaining_seconds > 0:
+                timer_tenths = _keepalive_tenths(remaining_seconds)
+
+        key = (self.is_connected, self.provider, usage, timer_tenths)
+        if key == self._toolbar_key:
+            return self._toolbar_tokens
+
         # Define styles for the toolbar components
         style_model = "class:toolbar.model"
         style_stats = "class:toolbar.stats"
         style_timer = "class:toolbar.timer"
 
-        tokens = []
+        tokens = [
+            # Connection status indicator
+            _TOK_CONN_UP if self.is_connected else _TOK_CONN_DOWN,
+            # Provider icon only
+            (style_model, f"{self._get_provider_icon(self.provider)} "),
+        ]
 
-        # Connection status indicator
-        conn_symbol = "*" if self.is_connected else "x"
-        conn_color = "ansigreen" if self.is_connected else "ansired"
-        tokens.append((f"fg:{conn_color}", f" {conn_symbol} "))
+        if usage is not None:
+            p, c, t = usage
+            tokens.append((style_stats, f" | In:{p} Out:{c} Total:{t}"))
 
-        # Provider icon only
-        provider_icon = self._get_provider_icon(self.provider)
-        tokens.append((style_model, f"{provider_icon} "))
+        if timer_tenths is not None:
+            tokens.append((style_stats, " | "))
+            tokens.append((style_timer, f"⏱ {timer_tenths / 10:.1f}m"))
 
-        # Usage Stats
-        if hasattr(self, "agent") and hasattr(self.agent, "get_last_usage"):
-            usage = self.agent.get_last_usage()
-            if usage["total_tokens"] > 0:
-                p = usage["prompt_tokens"]
-                c = usage["completion_tokens"]
-                t = usage["total_tokens"]
-                tokens.append((style_stats, f" | In:{p} Out:{c} Total:{t}"))
-
-        # Ollama keep-alive timer (only for ollama provider)
-        if self.provider == "ollama":
-            try:
-                from agent_cli.ollama_manager import get_ollama_manager
+        self._toolbar_key = key
+        self._toolbar_tokens = tokens
+        return tokens
 
-                ollama_mgr = get_ollama_manager()
-                remaining_seconds = ollama_mgr.get_time_remaining()
+    def _build_prompt_tokens(self, style: str = "class:prompt") -> list[tuple[str, str]]:
+        """Build the prompt tokens (provider icon and configurable name).
 
-                if remaining_seconds is not None and remaining_seconds > 0:
-                    remaining_mins = remaining_seconds / 60
-                    tokens.append((style_stats, " | "))
-                    tokens.append((style_timer, f"⏱ {remaining_mins:.1f}m"))
-            except Exception:
-                pass  # Silently fail if ollama_manager not available
+        Cached until the style, provider or configured prompt name changes.
+        """
+        prompt_name = self.ui.config.prompt_name
+        key = (style, self.provider, prompt_name)
+        if key != self._prompt_tokens_key:
+            icon = self._get_provider_icon(self.provider)
+            self._prompt_tokens_cache = [(style, f"{icon} {prompt_name} ➜ ")]
+            self._prompt_tokens_key = key
+        return self._prompt_tokens_cache
+
+    def _get_borders(self, theme_name: str, width: int) -> tuple[_Tokens, _Tokens]:
+        """Get the (top, bottom) prompt border tokens, cached per theme and width."""
+        key = (theme_name, width)
+        borders = self._border_cache.get(key)
+        if borders is not None:
+            self._border_cache.move_to_end(key)
+            return borders
+
+        # Border properties are only read from the theme on a cache miss
+        char = PRESET_THEMES[theme_name].get("prompt.border_char", "─")
+
+        # Solid and patterned borders (prompt.border_pattern) alike are a prefix
+        # of the repeated border char
+        target_len = max(0, width - 2)
+        stripe = _BORDER_STRIPES.get(char)
+        if stripe is None or len(stripe) < target_len:
+            stripe = _BORDER_STRIPES[char] = char * (max(1024, target_len) // len(char) + 1)
+        b_str = stripe[:target_len]
+
+        borders = ([("class:border", f"╭{b_str}╮")], [("class:border", f"╰{b_str}╯")])
+        self._border_cache[key] = borders
+        if len(self._border_cache) > _BORDER_CACHE_SIZE:
+            self._border_cache.popitem(last=False)
+        return borders
+
+    @cached_property
+    def _key_bindings(self):
+        """Key bindings for the boxed prompt, built once and shared by every prompt()."""
+        kb = KeyBindings()
 
-        return tokens
+        @kb.add("enter")
+        def _(event):
+            event.app.exit(result=event.current_buffer.text)
+
+        @kb.add("c-c")
+        def _(event):
+            event.app.exit(result=None)
+
+        @kb.add("tab")
+        def _(event):
+            """Handle tab completion."""
+            b = event.app.current_buffer
+            if b.complete_state:
+                b.complete_next()
+            else:
+                b.start_completion(select_first=False)
+
+        @kb.add("s-tab")
+        def _(event):
+            """Handle shift-tab for previous completion."""
+            b = event.app.current_buffer
+            if b.complete_state:
+                b.complete_previous()
+
+        return kb
+
+    def _on_text_changed(self, buffer) -> None:
+        """Auto-show completion menu when user types commands."""
+        text = buffer.text
+        # Plain chat input (the common case) or a menu already open: nothing to do
+        if not text.startswith("/") or buffer.complete_state:
+            return
+
+        # Auto-show for initial "/", and for commands with arguments
+        # (e.g., "/model ", "/provider ") when the command has sub-completions
+        if text == "/" or (
+            text.endswith(" ") and self.slash_completer.has_options(text.split(None, 1)[0])
+        ):
+            buffer.start_completion(select_first=False)
 
     def _get_status_subtitle(self) -> str:
         """Generate subtitle for response panels showing model and provider."""
@@ -654,88 +996,37 @@ class InteractiveSession:
 
     def prompt(self, default: str = "") -> str:
         """Get input from user with encapsulated style using custom container."""
-        from prompt_toolkit import Application
-        from prompt_toolkit.buffer import Buffer
-        from prompt_toolkit.key_binding import KeyBindings
-        from prompt_toolkit.layout import Layout
-        from prompt_toolkit.layout.containers import Float, FloatContainer, HSplit, VSplit, Window
-        from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
-        from prompt_toolkit.layout.menus import CompletionsMenu
-        from prompt_toolkit.styles import Style, merge_styles
-
         # Update style before prompt in case theme changed
         self.session.style = self.ui.theme_manager.get_current_style_for_prompt()
 
-        # Get border properties from current theme
+        # The simple theme uses a plain prompt; every other theme is boxed
         theme_name = self.ui.theme_manager.current_theme_name
-
-        # --- SIMPLE THEME (No Box) ---
         if theme_name == "simple":
-            # Use regular session prompt for simple theme
-            def get_bottom_toolbar_simple():
-                return self._get_toolbar_tokens()
-
-            from prompt_toolkit.styles import Style, merge_styles
-
-            simple_toolbar = Style.from_dict(
-                {
-                    "bottom-toolbar": "noreverse",
-                    "toolbar.model": "bold",
-                    "toolbar.stats": "#888888",
-                    "toolbar.timer": "ansiyellow",
-                    "toolbar.meta": "italic #888888",
-                }
-            )
-            final_style = merge_styles([self.session.style, simple_toolbar])
-
-            # Build prompt with provider icon and configurable name
-            icon = self._get_provider_icon(self.provider)
-            prompt_name = self.ui.config.prompt_name
-            prompt_text = f"{icon} {prompt_name} ➜ "
-
-            return self.session.prompt(
-                [("class:prompt.text", prompt_text)],
-                bottom_toolbar=get_bottom_toolbar_simple,
-                style=final_style,
-                refresh_interval=1.0,
-            )
-
-        # --- BOXED THEME (Custom Container) ---
-        rich_styles = PRESET_THEMES[theme_name]
-        border_color = rich_styles.get("prompt.border", "#888888")
-        char = rich_styles.get("prompt.border_char", "─")
-        border_pattern = rich_styles.get("prompt.border_pattern", "solid")
+            return self._prompt_simple(theme_name)
+        return self._prompt_boxed(theme_name)
+
+    def _prompt_simple(self, theme_name: str) -> str:
+        """Prompt without a box, using the regular session prompt and toolbar."""
+        return self.session.prompt(
+            self._build_prompt_tokens("class:prompt.text"),
+            bottom_toolbar=self._get_toolbar_tokens,
+            style=_session_prompt_style(theme_name),
+            refresh_interval=1.0,
+        )
 
+    def _prompt_boxed(self, theme_name: str) -> str:
+        """Prompt inside a bordered box, using a custom container."""
         # Create borders
-        width = self.ui.console.width
-
-        def make_border_line(start_char, end_char):
-            target_len = max(0, width - 2)
-            if border_pattern == "solid":
-                b_str = (char * target_len)[:target_len]
-            else:
-                repeats = (target_len // len(char)) + 1
-                b_str = (char * repeats)[:target_len]
-            return f"{start_char}{b_str}{end_char}"
-
-        top_border = make_border_line("╭", "╮")
-        bottom_border = make_border_line("╰", "╯")
+        top_tokens, bottom_tokens = self._get_borders(theme_name, self.ui.console.width)
 
         # Display status line (with timer) if using ollama provider
         if self.provider == "ollama":
-            try:
-                from agent_cli.ollama_manager import get_ollama_manager
-
-                ollama_mgr = get_ollama_manager()
-                remaining_seconds = ollama_mgr.get_time_remaining()
-
-                if remaining_seconds is not None and remaining_seconds > 0:
-                    remaining_mins = remaining_seconds / 60
-                    icon = self._get_provider_icon(self.provider)
-                    status = f"{icon} | ⏱ {remaining_mins:.1f}m"
-                    self.ui.console.print(f"[dim]{status}[/dim]", justify="right")
-            except Exception:
-                pass  # Silently fail if ollama_manager not available
+            remaining_seconds = self._ollama_remaining()
+            if remaining_seconds is not None and remaining_seconds > 0:
+                remaining_mins = _keepalive_tenths(remaining_seconds) / 10
+                icon = self._get_provider_icon(self.provider)
+                status = f"{icon} | ⏱ {remaining_mins:.1f}m"
+                self.ui.console.print(f"[dim]{status}[/dim]", justify="right")
 
         # Create buffer for input with completer attached
         buffer = Buffer(
@@ -744,69 +1035,39 @@ class InteractiveSession:
         )
 
         # Add handler to auto-show completion menu for commands and arguments
-        def on_text_changed(_):
-            """Auto-show completion menu when user types commands."""
-            text = buffer.text
-            if not buffer.complete_state:
-                # Auto-show for initial "/"
-                if text == "/":
-                    buffer.start_completion(select_first=False)
-                # Auto-show for commands with arguments (e.g., "/model ", "/provider ")
-                elif text.startswith("/") and text.endswith(" "):
-                    parts = text.split()
-                    if len(parts) >= 1:
-                        cmd = parts[0]
-                        # Check if this command has sub-completions
-                        if cmd in self.completer_dict and isinstance(self.completer_dict[cmd], dict):
-                            buffer.start_completion(select_first=False)
-
-        buffer.on_text_changed += on_text_changed
-
-        # Create style
-        custom_style = Style.from_dict(
-            {
-                "border": border_color,
-                "prompt": "bold",
-            }
-        )
-        final_style = merge_styles([self.session.style, custom_style])
+        buffer.on_text_changed += self._on_text_changed
 
         # Build layout with borders
         root_container = HSplit(
             [
                 # Top border
                 Window(
-                    content=FormattedTextControl(text=[("class:border", top_border)]),
+                    content=FormattedTextControl(text=top_tokens),
                     height=1,
                 ),
                 # Input line with left border, prompt, input, right border
                 VSplit(
                     [
                         Window(
-                            content=FormattedTextControl(text=[("class:border", "│ ")]),
+                            content=FormattedTextControl(text=_LEFT_BORDER_TOKENS),
                             width=2,
                         ),
                         Window(
-                            content=FormattedTextControl(
-                                text=[
-                                    (
-                                        "class:prompt",
-                                        f"{self._get_provider_icon(self.provider)} {self.ui.config.prompt_name} ➜ ",
-                                    )
-                                ]
-                            ),
+                            # Callable, so a provider/name change shows on the next
+                            # redraw; it returns its cached list until then
+                            content=FormattedTextControl(text=self._build_prompt_tokens),
                             dont_extend_width=True,
                         ),
                         Window(content=BufferControl(buffer=buffer)),
                         Window(
-                            content=FormattedTextControl(text=[("class:border", "│")]),
+                            content=FormattedTextControl(text=_RIGHT_BORDER_TOKENS),
                             width=1,
                         ),
                     ]
                 ),
                 # Bottom border
                 Window(
-                    content=FormattedTextControl(text=[("class:border", bottom_border)]),
+                    content=FormattedTextControl(text=bottom_tokens),
                     height=1,
                 ),
             ]
@@ -826,38 +1087,11 @@ class InteractiveSession:
 
         layout = Layout(float_container, focused_element=buffer)
 
-        # Key bindings
-        kb = KeyBindings()
-
-        @kb.add("enter")
-        def _(event):
-            event.app.exit(result=buffer.text)
-
-        @kb.add("c-c")
-        def _(event):
-            event.app.exit(result=None)
-
-        @kb.add("tab")
-        def _(event):
-            """Handle tab completion."""
-            b = event.app.current_buffer
-            if b.complete_state:
-                b.complete_next()
-            else:
-                b.start_completion(select_first=False)
-
-        @kb.add("s-tab")
-        def _(event):
-            """Handle shift-tab for previous completion."""
-            b = event.app.current_buffer
-            if b.complete_state:
-                b.complete_previous()
-
         # Create and run application
         app = Application(
             layout=layout,
-            key_bindings=kb,
-            style=final_style,
+            key_bindings=self._key_bindings,
+            style=_session_prompt_style(theme_name),
             full_screen=False,
         )
 
@@ -873,11 +1107,13 @@ class UI:
         from agent_cli.config import Config
         self.config = Config()
 
-        # Filter default theme styles
-        default_styles = {
-            k: v for k, v in PRESET_THEMES["default"].items() if k != "border.pattern"
-        }
-        self.console = Console(theme=Theme(default_styles))
+        # Default theme styles, filtered like any other theme
+        self.console = Console(theme=Theme(_RICH_STYLES_BY_THEME["default"]))
+        # Pending streamed text not yet written to the console
+        self._stream_buffer: list[str] = []
+        self._stream_buffered = 0
+        # Monotonic time of the last streamed write
+        self._stream_written_at = float("-inf")
         self.theme_manager = ThemeManager(self.console)
         self.interactive_session = InteractiveSession(self)
 
@@ -902,6 +1138,8 @@ class UI:
 
     def print_markdown(self, text: str):
         """Render markdown text."""
+        from rich.markdown import Markdown
+
         md = Markdown(text)
         self.console.print(md)
 
@@ -927,6 +1165,8 @@ class UI:
 
     def print_table(self, title: str, columns: list[str], rows: list[list[str]]):
         """Print a styled table."""
+        from rich.table import Table
+
         table = Table(title=title, show_header=True, header_style="header")
         for col in columns:
             table.add_column(col)
@@ -936,10 +1176,17 @@ class UI:
 
     def prompt_user(self, prompt_text: str = "You", default: Any = None) -> str:
         """Prompt the user for input. Deprecated in favor of interactive_session.prompt() for main loop."""
+        from rich.prompt import Prompt
+
         return Prompt.ask(f"[prompt]{prompt_text}[/prompt]", console=self.console, default=default)
 
     def print_agent_response(self, text: str, model: str):
         """Print a completed agent response."""
+        from rich.markdown import Markdown
+
+        # Any streamed text still buffered belongs before the panel
+        self.finalize_stream()
+
         # Get dynamic status subtitle from session
         subtitle = self.interactive_session._get_status_subtitle()
 
@@ -955,11 +1202,34 @@ class UI:
         )
 
     def print_stream_chunk(self, chunk: str):
-        """Print a chunk of streamed text (simple version)."""
-        self.console.print(chunk, end="")
+        """Print a chunk of streamed text (simple version).
+
+        Chunks are buffered and written together at line or sentence ends,
+        once enough text has accumulated, or when the last write is over 50ms
+        old; call finalize_stream() when the stream ends or fails.
+        """
+        self._stream_buffer.append(chunk)
+        self._stream_buffered += len(chunk)
+        if (
+            self._stream_buffered >= _STREAM_FLUSH_CHARS
+            or "\n" in chunk
+            or chunk.endswith(".")
+            or time.monotonic() - self._stream_written_at >= _STREAM_FLUSH_INTERVAL
+        ):
+            self.finalize_stream()
+
+    def finalize_stream(self):
+        """Write out any buffered stream chunks in a single console call."""
+        if self._stream_buffer:
+            # Raw model output: no markup parsing or highlighting
+            self.console.out("".join(self._stream_buffer), end="", highlight=False)
+            self._stream_buffer.clear()
+            self._stream_buffered = 0
+            self._stream_written_at = time.monotonic()
 
     def flush(self):
         """Flush the console output."""
+        self.finalize_stream()
         sys.stdout.flush()
 
 
@@ -0,0 +1,34 @@
+"""Unit tests for cli module."""
+
+import io
+
+import pytest
+
+from agent_cli.cli import handle_chat_response
+from agent_cli.ui import UI
+
+
+class FailingStreamAgent:
+    """Agent whose stream fails partway through a response."""
+
+    def stream(self, prompt, history):
+        yield "Partial"
+        yield " answer"
+        raise ConnectionError("connection lost")
+
+
+class TestHandleChatResponse:
+    """Test streamed chat responses."""
+
+    def test_stream_error_writes_partial_text(self):
+        """Test that text buffered before a stream error is written, not carried over."""
+        ui_instance = UI()
+        ui_instance.console.file = io.StringIO()
+
+        with pytest.raises(ConnectionError):
+            handle_chat_response(FailingStreamAgent(), "hi", [], True, "m", ui_instance)
+        assert "Partial answer" in ui_instance.console.file.getvalue()
+
+        # Nothing is left to leak into the next response
+        ui_instance.print_stream_chunk("Next reply.")
+        assert ui_instance.console.file.getvalue().endswith("Partial answerNext reply.")
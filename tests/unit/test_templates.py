@@ -0,0 +1,30 @@
+"""Unit tests for templates module."""
+
+from agent_cli.templates import TemplateLibrary
+
+
+class TestFindBestTemplate:
+    """Test template selection from detected project characteristics."""
+
+    def test_framework_mapping(self):
+        """Test that mapped framework names resolve to their template."""
+        library = TemplateLibrary()
+        assert library.find_best_template("javascript", ["next.js"]).id == "web-nextjs"
+        assert library.find_best_template("javascript", ["Express"]).id == "nodejs-backend"
+
+    def test_framework_matches_template_id(self):
+        """Test that frameworks contained in a template ID are matched."""
+        library = TemplateLibrary()
+        assert library.find_best_template("python", ["django"]).id == "python-django"
+        template = library.find_best_template("javascript", ["react-native"])
+        assert template.id == "mobile-react-native"
+
+    def test_language_fallback(self):
+        """Test fallback to the language's general template."""
+        library = TemplateLibrary()
+        assert library.find_best_template("python", ["pytest"]).id == "python-general"
+
+    def test_general_fallback(self):
+        """Test fallback to the general template."""
+        library = TemplateLibrary()
+        assert library.find_best_template("rust", []).id == "general"
@@ -0,0 +1,79 @@
+"""Unit tests for token_counter module."""
+
+from agent_cli.token_counter import TokenCounter
+
+
+class TestEstimateTokens:
+    """Test token estimation."""
+
+    def test_empty_text(self):
+        """Test that empty text has no tokens."""
+        assert TokenCounter.estimate_tokens("") == 0
+
+    def test_short_text_counts_at_least_one(self):
+        """Test that any non-empty text counts as at least one token."""
+        assert TokenCounter.estimate_tokens("hi") == 1
+
+    def test_ascii_text(self):
+        """Test estimation for plain English text."""
+        assert TokenCounter.estimate_tokens("a" * 400) == 100
+
+    def test_non_ascii_text_uses_utf8_length(self):
+        """Test that multi-byte scripts are not underestimated."""
+        text = "日本語のテキスト" * 10  # 80 chars, 240 UTF-8 bytes
+        assert TokenCounter.estimate_tokens(text) == 80
+        assert TokenCounter.estimate_tokens(text) > len(text) // 4
+
+    def test_mixed_text_estimates_parts_separately(self):
+        """Test that a few non-ASCII characters don't reprice ASCII text."""
+        text = "a" * 9000 + "\u2014"  # one em dash, 3 UTF-8 bytes
+        assert TokenCounter.estimate_tokens(text) == 9000 // 4 + 1
+
+
+class TestBatchEstimation:
+    """Test batch and message history estimation."""
+
+    def test_batch_matches_per_text_sum(self):
+        """Test that batch estimation equals summing individual estimates."""
+        texts = ["", "hi", "hello world" * 10, "x" * 1000] * 50
+        expected = sum(TokenCounter.estimate_tokens(t) for t in texts)
+        assert TokenCounter.estimate_texts_batch(texts) == expected
+
+    def test_messages_include_overhead(self):
+        """Test that each message adds structural overhead."""
+        messages = [{"role": "user", "content": "a" * 40}, {"role": "assistant"}]
+        assert TokenCounter.estimate_messages_tokens(messages) == 10 + 2 * 4
+
+    def test_empty_history(self):
+        """Test that an empty history has no tokens."""
+        assert TokenCounter.estimate_messages_tokens([]) == 0
+
+
+class TestFormatTokenCount:
+    """Test token count display formatting."""
+
+    def test_small_counts_are_plain(self):
+        """Test that counts below 1000 are shown as-is."""
+        assert TokenCounter.format_token_count(500) == "500"
+
+    def test_thousands(self):
+        """Test K suffix for thousands."""
+        assert TokenCounter.format_token_count(1_234) == "1.2K"
+
+    def test_millions(self):
+        """Test M suffix for millions."""
+        assert TokenCounter.format_token_count(2_500_000) == "2.5M"
+
+
+class TestContextPercentage:
+    """Test context window usage status."""
+
+    def test_status_thresholds(self):
+        """Test ok/warning/critical boundaries."""
+        assert TokenCounter.get_context_percentage(74, 100) == (74.0, "ok")
+        assert TokenCounter.get_context_percentage(75, 100) == (75.0, "warning")
+        assert TokenCounter.get_context_percentage(90, 100) == (90.0, "critical")
+
+    def test_zero_max_tokens(self):
+        """Test that a non-positive window reports ok."""
+        assert TokenCounter.get_context_percentage(10, 0) == (0.0, "ok")
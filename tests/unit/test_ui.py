@@ -0,0 +1,244 @@
+"""Unit tests for ui module."""
+
+import io
+
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from rich.console import Console
+from rich.errors import StyleSyntaxError
+
+from agent_cli import ui as ui_module
+from agent_cli.ui import UI, InteractiveSession, ThemeManager, _keepalive_tenths
+
+
+class TestThemeManager:
+    """Test theme switching."""
+
+    def test_failed_theme_keeps_previous_theme(self):
+        """Test that a theme Rich can't parse leaves the previous theme active."""
+        manager = ThemeManager(Console())
+        manager.set_theme("dracula")
+
+        # The simple theme uses prompt_toolkit color names (e.g. "ansiblue")
+        with pytest.raises(StyleSyntaxError):
+            manager.set_theme("simple")
+        assert manager.current_theme_name == "dracula"
+
+        # Later switches still replace the active theme
+        manager.set_theme("nord")
+        assert manager.current_theme_name == "nord"
+
+    def test_unknown_theme(self):
+        """Test that an unknown theme name is rejected."""
+        manager = ThemeManager(Console())
+        with pytest.raises(ValueError):
+            manager.set_theme("missing")
+
+
+class TestKeepaliveTenths:
+    """Test rounding of the keep-alive timer display."""
+
+    def test_rounds_half_up_to_tenths_of_a_minute(self):
+        """Test that seconds round to the nearest 6s step, halves rounding up."""
+        assert _keepalive_tenths(0) == 0
+        assert _keepalive_tenths(2) == 0
+        assert _keepalive_tenths(3) == 1
+        assert _keepalive_tenths(9) == 2  # 0.15m shows as 0.2m
+        assert _keepalive_tenths(56) == 9
+        assert _keepalive_tenths(57) == 10
+        assert _keepalive_tenths(300) == 50
+
+
+@pytest.fixture
+def stream_ui(monkeypatch):
+    """UI writing to a string buffer, with a frozen monotonic clock."""
+    clock = [1000.0]
+    monkeypatch.setattr(ui_module.time, "monotonic", lambda: clock[0])
+    instance = UI()
+    instance.console.file = io.StringIO()
+    instance.clock = clock
+    return instance
+
+
+def _output(instance: UI) -> str:
+    return instance.console.file.getvalue()
+
+
+class TestStreamOutput:
+    """Test buffering of streamed response text."""
+
+    def test_first_chunk_written_immediately(self, stream_ui):
+        """Test that a chunk arriving after an idle period is written at once."""
+        stream_ui.print_stream_chunk("Hello")
+        assert _output(stream_ui) == "Hello"
+
+    def test_chunks_buffered_between_writes(self, stream_ui):
+        """Test that quickly arriving chunks are held until a trigger."""
+        stream_ui.print_stream_chunk("Hello")
+        stream_ui.print_stream_chunk(" there")
+        stream_ui.print_stream_chunk(" friend")
+        assert _output(stream_ui) == "Hello"
+
+    def test_threshold_trigger(self, stream_ui):
+        """Test that enough pending text is written out."""
+        stream_ui.print_stream_chunk("start ")
+        stream_ui.print_stream_chunk("x" * (ui_module._STREAM_FLUSH_CHARS - 1))
+        assert _output(stream_ui) == "start "
+        stream_ui.print_stream_chunk("y")
+        assert _output(stream_ui) == "start " + "x" * (ui_module._STREAM_FLUSH_CHARS - 1) + "y"
+
+    def test_newline_trigger(self, stream_ui):
+        """Test that a chunk containing a newline writes pending text."""
+        stream_ui.print_stream_chunk("a")
+        stream_ui.print_stream_chunk("b")
+        stream_ui.print_stream_chunk("c\nd")
+        assert _output(stream_ui) == "abc\nd"
+
+    def test_sentence_trigger(self, stream_ui):
+        """Test that a chunk ending a sentence writes pending text."""
+        stream_ui.print_stream_chunk("a")
+        stream_ui.print_stream_chunk(" short")
+        stream_ui.print_stream_chunk(" sentence.")
+        assert _output(stream_ui) == "a short sentence."
+
+    def test_time_trigger(self, stream_ui):
+        """Test that a chunk arriving 50ms after the last write is written."""
+        stream_ui.print_stream_chunk("slow")
+        stream_ui.print_stream_chunk(" model")
+        assert _output(stream_ui) == "slow"
+        stream_ui.clock[0] += 0.1
+        stream_ui.print_stream_chunk(" output")
+        assert _output(stream_ui) == "slow model output"
+
+    def test_flush_drains_buffer(self, stream_ui):
+        """Test that flush() writes pending text."""
+        stream_ui.print_stream_chunk("a")
+        stream_ui.print_stream_chunk("b")
+        stream_ui.flush()
+        assert _output(stream_ui) == "ab"
+        stream_ui.flush()
+        assert _output(stream_ui) == "ab"
+
+    def test_agent_response_drains_buffer_first(self, stream_ui):
+        """Test that pending streamed text is written before a response panel."""
+        stream_ui.print_stream_chunk("a")
+        stream_ui.print_stream_chunk("pending")
+        stream_ui.print_agent_response("Panel text", "model")
+        output = _output(stream_ui)
+        assert output.startswith("apending")
+        assert output.index("pending") < output.index("Panel text")
+
+
+def _complete(completer, text: str) -> list[str]:
+    """Completion texts offered for text typed at the prompt."""
+    return [c.text for c in completer.get_completions(Document(text), CompleteEvent())]
+
+
+@pytest.fixture
+def completer():
+    """Slash command completer over a small command tree."""
+    commands = {
+        "/help": None,
+        "/model": {"llama3": None, "gpt-4o": None},
+        "/mode": None,
+        "/theme": {"dracula": None, "default": None, "nord": None},
+        "exit": None,
+    }
+    return InteractiveSession.SlashCommandCompleter(commands, None)
+
+
+class TestSlashCommandCompleter:
+    """Test slash command completion."""
+
+    def test_bare_slash_lists_all_commands(self, completer):
+        """Test that "/" offers every slash command, sorted, with descriptions."""
+        completions = list(completer.get_completions(Document("/"), CompleteEvent()))
+        assert [c.text for c in completions] == ["/help", "/mode", "/model", "/theme"]
+        assert all(c.start_position == -1 for c in completions)
+        assert completions[0].display_meta_text == "Show available commands"
+
+    def test_command_prefix(self, completer):
+        """Test that a partial command completes to the matching commands."""
+        assert _complete(completer, "/mo") == ["/mode", "/model"]
+
+    def test_subcommand_prefix(self, completer):
+        """Test that a partial argument completes to the matching options."""
+        completions = list(completer.get_completions(Document("/theme d"), CompleteEvent()))
+        assert [c.text for c in completions] == ["default", "dracula"]
+        assert all(c.start_position == -1 for c in completions)
+
+    def test_empty_argument_lists_options(self, completer):
+        """Test that a command followed by a space offers all its options."""
+        assert _complete(completer, "/model ") == ["gpt-4o", "llama3"]
+
+    def test_no_match(self, completer):
+        """Test that unmatched text and commands without options offer nothing."""
+        assert _complete(completer, "/zzz") == []
+        assert _complete(completer, "/help x") == []
+        assert _complete(completer, "hello") == []
+
+    def test_invalidate_picks_up_new_commands(self, completer):
+        """Test that invalidate() re-reads a replaced command tree."""
+        assert _complete(completer, "/") == ["/help", "/mode", "/model", "/theme"]
+        completer.commands = {**completer.commands, "/agent": {"list": None}}
+        completer.invalidate()
+        assert _complete(completer, "/") == ["/agent", "/help", "/mode", "/model", "/theme"]
+        assert _complete(completer, "/agent ") == ["list"]
+
+    def test_refresh_options(self, completer):
+        """Test that refresh_options() re-reads one command's options."""
+        assert _complete(completer, "/model ") == ["gpt-4o", "llama3"]
+        completer.commands = {**completer.commands, "/model": {"mistral": None}}
+        completer.refresh_options("/model")
+        assert _complete(completer, "/model ") == ["mistral"]
+
+
+@pytest.fixture
+def session():
+    """Interactive session over a small command tree, with its completer built."""
+    instance = InteractiveSession(None)
+    instance.completer_dict = {"/help": None, "/model": None}
+    _complete(instance.slash_completer, "/")  # build the sorted index
+    return instance
+
+
+class TestUpdateCompletionModels:
+    """Test refreshing model completions."""
+
+    def test_model_options_added(self, session):
+        """Test that /model gains options when it previously had none."""
+        session.update_completion_models(["llama3", "gpt-4o"])
+        assert session.completer_dict["/model"] == {"llama3": None, "gpt-4o": None}
+        assert session.slash_completer.commands is session.completer_dict
+        assert _complete(session.slash_completer, "/model ") == ["gpt-4o", "llama3"]
+
+    def test_model_options_replaced(self, session):
+        """Test that a changed model list replaces the previous options."""
+        session.update_completion_models(["llama3"])
+        previous = session.completer_dict
+        session.update_completion_models(["mistral", "qwen"])
+        assert session.completer_dict is not previous
+        assert previous["/model"] == {"llama3": None}
+        assert session.slash_completer.commands is session.completer_dict
+        assert _complete(session.slash_completer, "/model ") == ["mistral", "qwen"]
+
+    def test_unchanged_models_keep_dict(self, session):
+        """Test that the same set of models, in any order, changes nothing."""
+        session.update_completion_models(["llama3", "gpt-4o"])
+        commands = session.completer_dict
+        session.update_completion_models(["gpt-4o", "llama3"])
+        assert session.completer_dict is commands
+        assert session.slash_completer.commands is commands
+
+    def test_model_command_added(self, session):
+        """Test that a missing /model command is added and listed."""
+        session.completer_dict = {"/help": None}
+        session.slash_completer.commands = session.completer_dict
+        session.slash_completer.invalidate()
+        assert _complete(session.slash_completer, "/") == ["/help"]
+
+        session.update_completion_models(["llama3"])
+        assert session.slash_completer.commands is session.completer_dict
+        assert _complete(session.slash_completer, "/") == ["/help", "/model"]
+        assert _complete(session.slash_completer, "/model ") == ["llama3"]